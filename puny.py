@@ -9,12 +9,19 @@ import termios
 import tty
 import atexit
 import os
+import re
+import select
+import signal
 
 # Global state - in a real app you'd use a class, but this is simpler for learning
 original_tty = None  # Store original terminal settings
 filename = ""  # Current file being edited
-buffer = []  # Our text buffer: list of strings, one per line
+buffer = []  # Our text buffer: list of bytearrays, one per line
 dirty = False  # Flag: has buffer been modified since last save?
+_term_h, _term_w = 24, 80  # Cached terminal size; refreshed on SIGWINCH
+_line_hashes = []  # Hash of each row as last drawn; empty = full repaint
+_version = 0  # Bumped by anything that changes what's on screen
+_pending = b""  # Tail of a read that ended mid-escape-sequence
 
 
 # =============================================================================
@@ -36,6 +43,22 @@ def restore_tty():
         termios.tcsetattr(sys.stdin.fileno(), termios.TCSAFLUSH, original_tty)
 
 
+def _update_size(*_):
+    """
+    Refresh the cached terminal size. Installed as the SIGWINCH handler so
+    render() never has to issue the TIOCGWINSZ ioctl itself - querying the
+    size is a syscall, and render runs on every keystroke.
+    """
+    global _term_h, _term_w, _version
+    _version += 1
+    try:
+        size = os.get_terminal_size()
+        _term_h, _term_w = size.lines, size.columns
+    except OSError:
+        _term_h, _term_w = 24, 80  # Fallback
+    _line_hashes.clear()  # Geometry changed: force a full repaint
+
+
 def cleanup():
     """
     Cleanup function registered to run on exit (normal or crash).
@@ -55,16 +78,19 @@ def load_buffer(fname):
     """
     Load file into our buffer data structure.
     Milestone 0: Basic file reading
-    Milestone 2: Using list-of-strings buffer
+    Milestone 2: Using list-of-lines buffer
+
+    Lines are bytearrays so single-character edits mutate in place
+    (O(1)-ish memmove in C) instead of rebuilding the whole line string.
     """
     global buffer
     try:
-        with open(fname, 'r') as f:
+        with open(fname, 'rb') as f:
             # Remove trailing newlines - we'll add them back on save
-            buffer = [line.rstrip('\n') for line in f]
+            buffer = [bytearray(line.rstrip(b'\n')) for line in f]
     except FileNotFoundError:
         # New file: start with one empty line
-        buffer = [""]
+        buffer = [bytearray()]
 
 
 def save_buffer(fname):
@@ -72,23 +98,54 @@ def save_buffer(fname):
     Save buffer back to file.
     Milestone 0: Basic file writing
     """
-    with open(fname, 'w') as f:
-        f.write('\n'.join(buffer))
+    with open(fname, 'wb') as f:
+        f.write(b'\n'.join(buffer))
 
 
 # =============================================================================
 # Milestone 5: Editing Operations
 # =============================================================================
 
+# Lines are UTF-8 bytearrays, so cursor columns are byte offsets and a
+# character can span several bytes. Continuation bytes are 0x80-0xBF;
+# these helpers keep the cursor on character boundaries.
+
+def _prev_col(line, col):
+    """Step col one character left, skipping UTF-8 continuation bytes."""
+    col -= 1
+    while col > 0 and 0x80 <= line[col] <= 0xBF:
+        col -= 1
+    return col
+
+
+def _next_col(line, col):
+    """Step col one character right, skipping UTF-8 continuation bytes."""
+    col += 1
+    n = len(line)
+    while col < n and 0x80 <= line[col] <= 0xBF:
+        col += 1
+    return col
+
+
+def _align_col(line, col):
+    """Snap col back to a character boundary (e.g. after a row change)."""
+    while 0 < col < len(line) and 0x80 <= line[col] <= 0xBF:
+        col -= 1
+    return col
+
+
 def insert_char(line, col, char):
     """
     Insert a character at (line, col) position.
     Milestone 5: Basic text manipulation
     """
-    global buffer, dirty
+    global buffer, dirty, _version
     if 0 <= line < len(buffer):
-        buffer[line] = buffer[line][:col] + char + buffer[line][col:]
+        # In-place insert: shifts the tail in C rather than copying the
+        # whole line into a new string (O(line) allocation per keystroke)
+        buffer[line][col:col] = char.encode('utf-8')
         dirty = True
+        _version += 1
 
 
 def delete_char(line, col):
@@ -97,16 +154,56 @@ def delete_char(line, col):
     If at end of line, merges with next line.
     Milestone 5: Deletion with edge case handling
     """
-    global buffer, dirty
+    global buffer, dirty, _version
     if 0 <= line < len(buffer):
         if col < len(buffer[line]):
-            # Delete within line
-            buffer[line] = buffer[line][:col] + buffer[line][col + 1:]
+            # Delete the whole character starting at col (in-place,
+            # no new string) - may be more than one byte
+            del buffer[line][col:_next_col(buffer[line], col)]
             dirty = True
+            _version += 1
         elif col == len(buffer[line]) and line < len(buffer) - 1:
             # Merge with next line
             buffer[line] += buffer.pop(line + 1)
             dirty = True
+            _version += 1
+
+
+# Printable ASCII byte values, precomputed so the per-keystroke check is a
+# single set probe instead of two comparisons
+_PRINTABLE = frozenset(range(32, 127))
+
+# Matches the span delete_word removes - any leading whitespace plus the
+# following word, or bare trailing whitespace at end of line - in one pass
+# of the C regex engine. Bytes pattern because buffer lines are bytearrays.
+_DELETE_WORD_RE = re.compile(rb'\s*\S+|\s+')
+
+# Arrow-key escape codes (final byte of ESC [ X) mapped to (row delta,
+# col delta) - one dict probe replaces a chain of comparisons
+_ARROWS = {
+    ord('A'): (-1, 0),  # Up
+    ord('B'): (1, 0),   # Down
+    ord('C'): (0, 1),   # Right
+    ord('D'): (0, -1),  # Left
+}
+
+
+def delete_word(line, col):
+    """
+    Delete from (line, col) through the end of the next word,
+    including any whitespace between the cursor and the word.
+    Bound to Ctrl+W.
+    """
+    global buffer, dirty, _version
+    if 0 <= line < len(buffer):
+        text = buffer[line]
+        # One anchored match finds the whole span to remove - whitespace
+        # skip and word scan in a single pass of the C regex engine
+        m = _DELETE_WORD_RE.match(text, col)
+        if m:
+            del text[col:m.end()]
+            dirty = True
+            _version += 1
 
 
 # =============================================================================
@@ -124,33 +221,50 @@ def render(cursor_row, cursor_col):
     Milestone 3: Basic rendering
     Milestone 6: Status bar addition
     """
-    # Clear screen and move to top-left
-    sys.stdout.write("\x1b[2J\x1b[H")
+    # Accumulate the frame and write it once: one Python->C dispatch and
+    # (at most) one syscall per frame. Only rows whose content changed
+    # since the last frame are re-emitted, so the bytes pushed to the
+    # terminal scale with the edit, not with the buffer size.
+    out = []
+    rows = len(buffer)
+    cached = len(_line_hashes)
+    if cached == 0:
+        # First frame or resize: clear and draw everything. bytes.join runs
+        # the whole concatenation in C - no per-row Python loop.
+        out.append("\x1b[2J\x1b[H" + b"\r\n".join(buffer).decode('utf-8', 'replace'))
+        _line_hashes.extend(hash(bytes(line)) for line in buffer)
+    else:
+        if cached > rows:
+            # Buffer shrank: blank the rows that no longer exist
+            for i in range(rows, cached):
+                out.append(f"\x1b[{i + 1};1H\x1b[2K")
+            del _line_hashes[rows:]
+        else:
+            _line_hashes.extend([None] * (rows - cached))
 
-    # Print each line of the buffer
-    for line in buffer:
-        sys.stdout.write(line + "\r\n")
+        for i, line in enumerate(buffer):
+            h = hash(bytes(line))
+            if h != _line_hashes[i]:
+                out.append(f"\x1b[{i + 1};1H\x1b[2K" + line.decode('utf-8', 'replace'))
+                _line_hashes[i] = h
 
-    # Get terminal dimensions for status bar
-    try:
-        height = os.get_terminal_size().lines
-        width = os.get_terminal_size().columns
-    except OSError:
-        height, width = 24, 80  # Fallback
+    # Terminal dimensions for the status bar, from the SIGWINCH-backed cache
+    height, width = _term_h, _term_w
+
+    # Screen columns count characters, not bytes - decode up to the cursor
+    screen_col = len(buffer[cursor_row][:cursor_col].decode('utf-8', 'replace'))
 
     # Build status bar text
-    status = f"{filename} | Line {cursor_row + 1}, Col {cursor_col + 1} | {len(buffer)} lines"
+    status = f"{filename} | Line {cursor_row + 1}, Col {screen_col + 1} | {len(buffer)} lines"
     if dirty:
         status += " | [Modified]"
 
-    # Move to bottom row, use inverse video for status bar
-    sys.stdout.write(f"\x1b[{height};1H")  # Set cursor position
-    sys.stdout.write("\x1b[7m")  # Enable inverse video
-    sys.stdout.write(status[:width].ljust(width))  # Truncate/pad to width
-    sys.stdout.write("\x1b[0m")  # Reset all attributes
+    # Status bar on the bottom row in inverse video, then position the
+    # cursor back in the buffer area
+    out.append(f"\x1b[{height};1H\x1b[7m{status[:width].ljust(width)}\x1b[0m")
+    out.append(f"\x1b[{cursor_row + 1};{screen_col + 1}H")
 
-    # Position cursor in buffer area
-    sys.stdout.write(f"\x1b[{cursor_row + 1};{cursor_col + 1}H")
+    sys.stdout.write("".join(out))
     sys.stdout.flush()  # Ensure all output is written
 
 
@@ -160,81 +274,115 @@ def render(cursor_row, cursor_col):
 
 def handle_input(cursor_row, cursor_col):
     """
-    Process a single keyboard input.
+    Process all keyboard input returned by a single read.
     Returns updated (cursor_row, cursor_col).
 
+    One os.read() fetches everything the kernel has queued - a complete
+    escape sequence, or many bytes on paste/autorepeat - in one syscall,
+    instead of a read(1) per byte (three per arrow key).
+
     Milestone 4: Cursor movement (arrow keys)
     Milestone 5: Editing (insert/delete)
     Milestone 7: Save/quit UI (Ctrl+S, Ctrl+Q)
     """
-    ch = sys.stdin.read(1)
-
-    # Escape sequences (arrow keys, Home, End, etc.)
-    if ch == '\x1b':  # ESC
-        ch2 = sys.stdin.read(1)
-        ch3 = sys.stdin.read(1)
-        if ch2 == '[':
-            if ch3 == 'A':  # Up arrow
-                cursor_row = max(0, cursor_row - 1)
-            elif ch3 == 'B':  # Down arrow
-                cursor_row = min(len(buffer) - 1, cursor_row + 1)
-            elif ch3 == 'C':  # Right arrow
-                cursor_col = min(len(buffer[cursor_row]), cursor_col + 1)
-            elif ch3 == 'D':  # Left arrow
-                cursor_col = max(0, cursor_col - 1)
-        return cursor_row, cursor_col
-
-    # Enter key - split line
-    if ch == '\r' or ch == '\n':
-        line = buffer[cursor_row]
-        buffer.insert(cursor_row + 1, line[cursor_col:])
-        buffer[cursor_row] = line[:cursor_col]
-        cursor_row += 1
-        cursor_col = 0
-        return cursor_row, cursor_col
-
-    # Backspace (DEL character)
-    if ch == '\x7f':
-        if cursor_col > 0:
-            delete_char(cursor_row, cursor_col - 1)
-            cursor_col -= 1
-        elif cursor_row > 0:
-            # Merge with previous line
-            cursor_row -= 1
-            cursor_col = len(buffer[cursor_row])
-            buffer[cursor_row] += buffer.pop(cursor_row + 1)
-        return cursor_row, cursor_col
-
-    # Ctrl+D - delete forward
-    if ch == '\x04':
-        delete_char(cursor_row, cursor_col)
-        return cursor_row, cursor_col
-
-    # Ctrl+S - save
-    if ch == '\x13':
-        save_buffer(filename)
-        global dirty
-        dirty = False
-        return cursor_row, cursor_col
-
-    # Ctrl+Q - quit with confirmation if dirty
-    if ch == '\x11':
-        if dirty:
-            # Simple prompt interface
-            sys.stdout.write("\x1b[2J\x1b[H\x1b[2K")
-            sys.stdout.write("Quit without saving? (y/N) ")
-            sys.stdout.flush()
-            response = sys.stdin.read(1)
-            if response.lower() == 'y':
+    global dirty, _version, _pending
+
+    fd = sys.stdin.fileno()
+    data = _pending + os.read(fd, 64)
+    _pending = b""
+    i = 0
+    n = len(data)
+    while i < n:
+        b = data[i]
+
+        # Escape sequences (arrow keys, Home, End, etc.)
+        if b == 0x1b:  # ESC
+            if i + 2 < n and data[i + 1] == 0x5b:  # '['
+                delta = _ARROWS.get(data[i + 2])
+                if delta:
+                    dr, dc = delta
+                    if dr:
+                        cursor_row = max(0, min(len(buffer) - 1, cursor_row + dr))
+                        line = buffer[cursor_row]
+                        cursor_col = _align_col(line, min(cursor_col, len(line)))
+                    elif dc > 0:
+                        line = buffer[cursor_row]
+                        if cursor_col < len(line):
+                            cursor_col = _next_col(line, cursor_col)
+                    elif cursor_col > 0:
+                        cursor_col = _prev_col(buffer[cursor_row], cursor_col)
+                i += 3
+            elif n - i == 1 or data[i + 1] == 0x5b:
+                # Chunk ended mid-sequence: keep the tail for the next
+                # read so the continuation bytes aren't mistaken for text
+                _pending = bytes(data[i:])
+                break
+            else:
+                i += 1  # ESC followed by a non-sequence byte: ignore
+            continue
+        i += 1
+
+        # Enter key - split line
+        if b == 0x0d or b == 0x0a:
+            line = buffer[cursor_row]
+            buffer.insert(cursor_row + 1, line[cursor_col:])
+            buffer[cursor_row] = line[:cursor_col]
+            cursor_row += 1
+            cursor_col = 0
+            _version += 1
+            continue
+
+        # Backspace (DEL character)
+        if b == 0x7f:
+            if cursor_col > 0:
+                cursor_col = _prev_col(buffer[cursor_row], cursor_col)
+                delete_char(cursor_row, cursor_col)
+            elif cursor_row > 0:
+                # Merge with previous line
+                cursor_row -= 1
+                cursor_col = len(buffer[cursor_row])
+                buffer[cursor_row] += buffer.pop(cursor_row + 1)
+                _version += 1
+            continue
+
+        # Ctrl+D - delete forward
+        if b == 0x04:
+            delete_char(cursor_row, cursor_col)
+            continue
+
+        # Ctrl+W - delete word forward
+        if b == 0x17:
+            delete_word(cursor_row, cursor_col)
+            continue
+
+        # Ctrl+S - save
+        if b == 0x13:
+            save_buffer(filename)
+            dirty = False
+            _version += 1  # Status bar loses its [Modified] tag
+            continue
+
+        # Ctrl+Q - quit with confirmation if dirty
+        if b == 0x11:
+            if dirty:
+                # Simple prompt interface
+                sys.stdout.write("\x1b[2J\x1b[H\x1b[2K")
+                sys.stdout.write("Quit without saving? (y/N) ")
+                sys.stdout.flush()
+                response = os.read(fd, 1)
+                if response in (b'y', b'Y'):
+                    sys.exit(0)
+                # The prompt clobbered the screen - force a full repaint
+                _line_hashes.clear()
+                _version += 1
+            else:
                 sys.exit(0)
-        else:
-            sys.exit(0)
-        return cursor_row, cursor_col
+            continue
 
-    # Printable ASCII characters
-    if 32 <= ord(ch) <= 126:
-        insert_char(cursor_row, cursor_col, ch)
-        cursor_col += 1
+        # Printable ASCII characters
+        if b in _PRINTABLE:
+            insert_char(cursor_row, cursor_col, chr(b))
+            cursor_col += 1
 
     return cursor_row, cursor_col
 
@@ -260,15 +408,34 @@ def main():
     atexit.register(cleanup)  # Ensure cleanup on crash
     tty.setraw(sys.stdin.fileno())  # Disable line buffering and echo
 
+    # Prime the size cache and keep it fresh on window resizes
+    _update_size()
+    signal.signal(signal.SIGWINCH, _update_size)
+
     cursor_row, cursor_col = 0, 0
+    last_frame = None  # (version, cursor) of the last rendered frame
 
     try:
         while True:
-            render(cursor_row, cursor_col)
+            # Skip the frame entirely when nothing visible changed -
+            # e.g. key chords we ignore, or a no-op cursor move at an edge
+            frame = (_version, cursor_row, cursor_col)
+            if frame != last_frame:
+                render(cursor_row, cursor_col)
+                last_frame = frame
             cursor_row, cursor_col = handle_input(cursor_row, cursor_col)
 
-            # Ensure cursor stays within line bounds
-            cursor_col = min(cursor_col, len(buffer[cursor_row]))
+            # Ensure cursor stays within line bounds, on a char boundary
+            line = buffer[cursor_row]
+            cursor_col = _align_col(line, min(cursor_col, len(line)))
+
+            # Drain any input that queued up while we were busy (fast typing,
+            # paste, key autorepeat) before repainting, so a burst of N keys
+            # costs one render instead of N.
+            while select.select([sys.stdin], [], [], 0)[0]:
+                cursor_row, cursor_col = handle_input(cursor_row, cursor_col)
+                line = buffer[cursor_row]
+                cursor_col = _align_col(line, min(cursor_col, len(line)))
     except KeyboardInterrupt:
         cleanup()
         sys.exit(0)